@@ -7,7 +7,7 @@ from .dataclasses import AttemptState, Phase
 from .protocols import WaitTimeProvider
 from .sync import AttemptContext, AttemptGenerator, attempting
 
-__all__ = [
+__all__ = (
     "AsyncAttemptContext",
     "AsyncAttemptGenerator",
     "AttemptContext",
@@ -17,4 +17,4 @@ __all__ = [
     "WaitTimeProvider",
     "attempting",
     "attempting_async",
-]
+)
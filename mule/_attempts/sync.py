@@ -3,14 +3,15 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from inspect import iscoroutinefunction
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Literal
 
 from mule._attempts.protocols import HookType
-from mule.stop_conditions import NoException, StopCondition
+from mule.stop_conditions import NoException, StopCondition, UnionStopCondition
 
 from .dataclasses import AttemptState, Phase
 
@@ -23,6 +24,21 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger("mule")
 
+# Superseded attempt contexts are recycled through a small free list so
+# retry-heavy callers don't allocate a fresh context per attempt. The pool
+# is thread-local: an unsynchronized shared list would race between the
+# emptiness check and the pop when generators run on multiple threads.
+_MAX_POOL = 64
+_pool_local = threading.local()
+
+
+def _get_context_pool() -> list[AttemptContext]:
+    try:
+        return _pool_local.contexts
+    except AttributeError:
+        pool = _pool_local.contexts = []
+        return pool
+
 
 class AttemptGenerator:
     """
@@ -31,6 +47,29 @@ class AttemptGenerator:
     The stopping condition is defined by the `StopCondition` protocol.
     """
 
+    __slots__ = (
+        "_check",
+        "_last_attempt",
+        "_scratch_state",
+        "_wait_provider",
+        "_wait_seconds",
+        "after_wait",
+        "before_attempt",
+        "before_wait",
+        "on_failure",
+        "on_success",
+        "stop_condition",
+        "wait",
+    )
+
+    def __new__(cls, **kwargs: Any) -> AttemptGenerator:
+        # Most callers configure no wait; give them a subclass whose wait
+        # step is a no-op instead of re-checking the wait config per attempt.
+        # __init__ is keyword-only, so there are no positional args to accept.
+        if cls is AttemptGenerator and kwargs.get("wait") is None:
+            return object.__new__(_NoWaitAttemptGenerator)
+        return object.__new__(cls)
+
     def __init__(
         self,
         *,
@@ -59,10 +98,34 @@ class AttemptGenerator:
         """
         if until is None:
             self.stop_condition = NoException()
+        elif isinstance(until, UnionStopCondition) and any(
+            isinstance(condition, NoException) for condition in until.conditions
+        ):
+            # Already composed with NoException (e.g. by Retriable); reuse as-is.
+            self.stop_condition: StopCondition = until
         else:
-            self.stop_condition: StopCondition = until | NoException()
+            self.stop_condition = until | NoException()
+        # Bind once; check is re-resolved on every iteration otherwise.
+        self._check = self.stop_condition.check
         self.wait = wait
-        self._attempts: list[AttemptContext] = []
+        # Resolve the wait dispatch once so each attempt avoids repeated
+        # callable/isinstance checks.
+        self._wait_provider: WaitTimeProvider | None = None
+        self._wait_seconds: float | None = None
+        if callable(wait):
+            self._wait_provider = wait
+        elif isinstance(wait, datetime.timedelta):
+            # A zero timedelta is falsy and means "no wait", the same as
+            # passing 0 or 0.0.
+            seconds = wait.total_seconds()
+            if seconds:
+                self._wait_seconds = seconds
+        elif wait:
+            self._wait_seconds = float(wait)
+        self._last_attempt: AttemptContext | None = None
+        # Reused for stop-condition checks so each iteration doesn't
+        # allocate a fresh AttemptState snapshot.
+        self._scratch_state = AttemptState(attempt=0)
         self.before_attempt = before_attempt
         self.on_success = on_success
         self.on_failure = on_failure
@@ -74,34 +137,74 @@ class AttemptGenerator:
         """
         Get the last attempt context.
         """
-        if not self._attempts:
-            return None
-        return self._attempts[-1]
+        return self._last_attempt
 
     def get_next_attempt(self) -> AttemptContext:
         """
         Get the next attempt context.
         """
-        if not self.last_attempt:
+        last_attempt = self._last_attempt
+        if last_attempt is not None:
+            # Mutate the superseded context in place instead of cycling it
+            # through the pool; the caller has already moved past it.
+            last_attempt._reset(
+                attempt=last_attempt.attempt + 1,
+                before_attempt=self.before_attempt,
+                on_success=self.on_success,
+                on_failure=self.on_failure,
+            )
+            return last_attempt
+        pool = _get_context_pool()
+        if pool:
+            next_attempt = pool.pop()
+            next_attempt._reset(
+                attempt=1,
+                before_attempt=self.before_attempt,
+                on_success=self.on_success,
+                on_failure=self.on_failure,
+            )
+        else:
             next_attempt = AttemptContext(
                 attempt=1,
                 before_attempt=self.before_attempt,
                 on_success=self.on_success,
                 on_failure=self.on_failure,
             )
-            self._attempts.append(next_attempt)
-            return next_attempt
-        next_attempt = AttemptContext(
-            attempt=self.last_attempt.attempt + 1,
-            before_attempt=self.before_attempt,
-            on_success=self.on_success,
-            on_failure=self.on_failure,
-        )
-        self._attempts.append(next_attempt)
+        self._last_attempt = next_attempt
         return next_attempt
 
-    def __iter__(self) -> AttemptGenerator:
-        return self
+    def reset(self) -> None:
+        """
+        Clear attempt state so this generator can be reused for a new call.
+        """
+        last_attempt = self._last_attempt
+        if last_attempt is not None:
+            last_attempt._release()
+            self._last_attempt = None
+
+    def __iter__(self) -> Iterator[AttemptContext]:
+        # A generator function keeps the hot names in frame locals, so each
+        # step is a LOAD_FAST instead of repeated attribute lookups on self.
+        check = self._check
+        get_next_attempt = self.get_next_attempt
+        wait_for_next_attempt = self._wait_for_next_attempt
+        scratch_state = self._scratch_state
+        while True:
+            last_attempt = self._last_attempt
+            # A None state means "before the first attempt"; user-defined
+            # conditions may legitimately stop there.
+            done, last_exception = check(
+                last_attempt._copy_into(scratch_state)
+                if last_attempt is not None
+                else None
+            )
+            if done:
+                if last_exception is not None:
+                    raise last_exception
+                return
+            attempt = get_next_attempt()
+            wait_for_next_attempt(attempt)
+            yield attempt
 
     def _call_hooks(
         self, attempt: AttemptContext, hooks_type: Literal["before_wait", "after_wait"]
@@ -130,32 +233,44 @@ class AttemptGenerator:
         Args:
             attempt: The current AttemptContext.
         """
-        if attempt.attempt > 1 and self.wait:
-            wait_time = self.wait
-            if callable(wait_time):
-                wait_time = wait_time(
+        if attempt.attempt > 1:
+            wait_seconds = self._wait_seconds
+            if wait_seconds is None:
+                if self._wait_provider is None:
+                    return
+                wait_time = self._wait_provider(
                     self.last_attempt.to_attempt_state() if self.last_attempt else None,
                     attempt.to_attempt_state(),
                 )
-            if wait_time is not None:
-                wait_seconds = (
-                    wait_time.total_seconds()
-                    if isinstance(wait_time, datetime.timedelta)
-                    else float(wait_time)
-                )
-                attempt.wait_seconds = wait_seconds
-                attempt.phase = Phase.WAITING
+                if wait_time is None:
+                    return
+                # Exact-type check first: providers overwhelmingly return
+                # plain floats, which need no conversion at all.
+                if type(wait_time) is float:
+                    wait_seconds = wait_time
+                elif isinstance(wait_time, datetime.timedelta):
+                    wait_seconds = wait_time.total_seconds()
+                else:
+                    wait_seconds = float(wait_time)
+            attempt.wait_seconds = wait_seconds
+            attempt.phase = Phase.WAITING
+            if self.before_wait:
                 self._call_hooks(attempt, "before_wait")
-                time.sleep(wait_seconds)
-                attempt.phase = Phase.PENDING
-                attempt.wait_seconds = None
+            time.sleep(wait_seconds)
+            attempt.phase = Phase.PENDING
+            attempt.wait_seconds = None
+            if self.after_wait:
                 self._call_hooks(attempt, "after_wait")
 
     def __next__(self) -> AttemptContext:
-        if self.stop_condition.is_met(
-            self.last_attempt.to_attempt_state() if self.last_attempt else None
-        ):
-            if self.last_attempt and (last_exception := self.last_attempt.exception):
+        last_attempt = self._last_attempt
+        done, last_exception = self._check(
+            last_attempt._copy_into(self._scratch_state)
+            if last_attempt is not None
+            else None
+        )
+        if done:
+            if last_exception is not None:
                 raise last_exception
             raise StopIteration
 
@@ -164,6 +279,17 @@ class AttemptGenerator:
         return attempt
 
 
+class _NoWaitAttemptGenerator(AttemptGenerator):
+    """
+    An `AttemptGenerator` specialization used when no wait is configured.
+    """
+
+    __slots__ = ()
+
+    def _wait_for_next_attempt(self, attempt: AttemptContext) -> None:
+        pass
+
+
 class AttemptContext:
     """
     A context manager that represents an attempt.
@@ -173,6 +299,17 @@ class AttemptContext:
     attempt.
     """
 
+    __slots__ = (
+        "attempt",
+        "before_attempt",
+        "exception",
+        "on_failure",
+        "on_success",
+        "phase",
+        "result",
+        "wait_seconds",
+    )
+
     def __init__(
         self,
         attempt: int,
@@ -190,6 +327,33 @@ class AttemptContext:
         self.on_success = on_success
         self.on_failure = on_failure
 
+    def _reset(
+        self,
+        attempt: int,
+        before_attempt: Sequence[AttemptHook | AsyncAttemptHook] = (),
+        on_success: Sequence[AttemptHook | AsyncAttemptHook] = (),
+        on_failure: Sequence[AttemptHook | AsyncAttemptHook] = (),
+    ) -> None:
+        """
+        Reinitialize a pooled context for reuse.
+        """
+        self.attempt = attempt
+        self.exception = None
+        self.result = ...
+        self.wait_seconds = None
+        self.phase = Phase.PENDING
+        self.before_attempt = before_attempt
+        self.on_success = on_success
+        self.on_failure = on_failure
+
+    def _release(self) -> None:
+        """
+        Return this context to the free list once it has been superseded.
+        """
+        pool = _get_context_pool()
+        if len(pool) < _MAX_POOL:
+            pool.append(self)
+
     def _call_hooks(
         self, hooks_type: Literal["before_attempt", "on_success", "on_failure"]
     ) -> None:
@@ -213,7 +377,10 @@ class AttemptContext:
             _call_async_hooks(async_hooks, self.to_attempt_state(), hooks_type)
 
     def __enter__(self) -> AttemptContext:
-        self._call_hooks("before_attempt")
+        # Guard at the call site so the no-hooks case skips the dispatch and
+        # snapshot machinery entirely.
+        if self.before_attempt:
+            self._call_hooks("before_attempt")
         self.phase = Phase.RUNNING
         return self
 
@@ -226,12 +393,28 @@ class AttemptContext:
         if _exc_value:
             self.exception = _exc_value
             self.phase = Phase.FAILED
-            self._call_hooks("on_failure")
+            if self.on_failure:
+                self._call_hooks("on_failure")
         else:
             self.phase = Phase.SUCCEEDED
-            self._call_hooks("on_success")
+            if self.on_success:
+                self._call_hooks("on_success")
         return True
 
+    def _copy_into(self, state: AttemptState) -> AttemptState:
+        """
+        Copy this context's fields into an existing AttemptState.
+
+        Used for transient snapshots (e.g. stop-condition checks) where the
+        state is consumed immediately and a fresh allocation would be waste.
+        """
+        state.attempt = self.attempt
+        state.exception = self.exception
+        state.result = self.result
+        state.wait_seconds = self.wait_seconds
+        state.phase = self.phase
+        return state
+
     def to_attempt_state(self) -> AttemptState:
         return AttemptState(
             attempt=self.attempt,
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-from collections.abc import Awaitable
-from functools import partial, update_wrapper
+import threading
+import time
+from collections.abc import Awaitable, Iterable
 from inspect import iscoroutinefunction
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Generic,
     TypeVar,
@@ -16,14 +19,33 @@ from typing import (
 
 from typing_extensions import ParamSpec
 
-from mule._attempts import AsyncAttemptGenerator, AttemptGenerator, WaitTimeProvider
+from mule._attempts import (
+    AsyncAttemptGenerator,
+    AttemptGenerator,
+    Phase,
+    WaitTimeProvider,
+)
 from mule._attempts.protocols import AsyncAttemptHook, AttemptHook
-from mule.stop_conditions import StopCondition
+from mule.stop_conditions import AttemptsExhausted, NoException, StopCondition
 
 P = ParamSpec("P")
 R = TypeVar("R")
 H = TypeVar("H", bound=Union[AttemptHook, AsyncAttemptHook])
 
+# Inlined from functools.update_wrapper to skip the per-attribute exception
+# handling when modules decorate many functions at import time.
+_WRAPPER_ATTRIBUTES = (
+    "__module__",
+    "__name__",
+    "__qualname__",
+    # Only present on 3.12+ generic functions; getattr's default skips it
+    # elsewhere, mirroring functools.WRAPPER_ASSIGNMENTS.
+    "__type_params__",
+    "__annotations__",
+    "__doc__",
+)
+_UNSET = object()
+
 
 class Retriable(Generic[P, R]):
     """
@@ -40,6 +62,29 @@ class Retriable(Generic[P, R]):
             AttemptContext and returns a timedelta, seconds, or None.
     """
 
+    # Hot attributes live in slots so __call__ reads them through C-level
+    # descriptors; __dict__ stays for the copied wrapper metadata, which
+    # varies per wrapped function.
+    __slots__ = (
+        "__dict__",
+        "__wrapped__",
+        "_counted_retries",
+        "_has_hooks",
+        "_is_coroutine_fn",
+        "_local",
+        "_max_attempts",
+        "_stop_condition",
+        "_wait_seconds",
+        "after_wait_hooks",
+        "before_attempt_hooks",
+        "before_wait_hooks",
+        "fn",
+        "on_failure_hooks",
+        "on_success_hooks",
+        "until",
+        "wait",
+    )
+
     def __init__(
         self,
         __fn: Callable[P, R],
@@ -48,55 +93,220 @@ class Retriable(Generic[P, R]):
         wait: datetime.timedelta | int | float | None | WaitTimeProvider = None,
     ):
         self.fn = __fn
-        update_wrapper(self, __fn)
+        for attribute in _WRAPPER_ATTRIBUTES:
+            value = getattr(__fn, attribute, _UNSET)
+            if value is not _UNSET:
+                setattr(self, attribute, value)
+        fn_dict = getattr(__fn, "__dict__", None)
+        if fn_dict:
+            self.__dict__.update(fn_dict)
+        self.__wrapped__ = __fn
+        # The wrapped function never changes, so resolve the sync/async branch
+        # once instead of calling iscoroutinefunction on every invocation.
+        self._is_coroutine_fn = iscoroutinefunction(__fn)
         self.until = until
+        # Compose the stop condition once so each call skips the `|` dispatch.
+        self._stop_condition: StopCondition = (
+            NoException() if until is None else until | NoException()
+        )
         self.wait = wait
+        # When the stop condition is a bare AttemptsExhausted and the wait
+        # is constant (or absent), retries can run as a plain counted loop
+        # with no generator.
+        self._max_attempts: int | None = (
+            until.max_attempts if type(until) is AttemptsExhausted else None
+        )
+        if callable(wait) or not wait:
+            self._wait_seconds: float | None = None
+        elif isinstance(wait, datetime.timedelta):
+            self._wait_seconds = wait.total_seconds()
+        else:
+            self._wait_seconds = float(wait)
+        # Decided once at construction so the retry paths don't re-derive
+        # eligibility for the counted loop on every failure.
+        self._counted_retries = self._max_attempts is not None and (
+            wait is None or self._wait_seconds is not None
+        )
         self.before_attempt_hooks: list[AttemptHook | AsyncAttemptHook] = []
         self.on_success_hooks: list[AttemptHook | AsyncAttemptHook] = []
         self.on_failure_hooks: list[AttemptHook | AsyncAttemptHook] = []
         self.before_wait_hooks: list[AttemptHook | AsyncAttemptHook] = []
         self.after_wait_hooks: list[AttemptHook | AsyncAttemptHook] = []
+        # Tracks whether any hook has been registered; while False, calls can
+        # take the fast path that skips attempt-context ceremony on success.
+        self._has_hooks = False
+        # Per-thread generator cache; reset-and-reuse avoids allocating a
+        # fresh generator on every call of a hot decorated function.
+        self._local = threading.local()
+
+    def _new_sync_generator(self) -> AttemptGenerator:
+        return AttemptGenerator(
+            until=self._stop_condition,
+            wait=self.wait,
+            before_attempt=self.before_attempt_hooks,
+            on_success=self.on_success_hooks,
+            on_failure=self.on_failure_hooks,
+            before_wait=self.before_wait_hooks,
+            after_wait=self.after_wait_hooks,
+        )
 
-    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
-        if iscoroutinefunction(self.fn):
-            return self._call_async(*args, **kwargs)  # pyright: ignore[reportReturnType]
-
-        for attempt in AttemptGenerator(
-            until=self.until,
+    def _acquire_sync_generator(self) -> AttemptGenerator:
+        """
+        Get this thread's cached generator, or a fresh one if it is in use.
+        """
+        local = self._local
+        if getattr(local, "sync_generator_in_use", False):
+            # Re-entrant call on this thread; don't share iteration state.
+            return self._new_sync_generator()
+        generator = getattr(local, "sync_generator", None)
+        if generator is None:
+            generator = local.sync_generator = self._new_sync_generator()
+        else:
+            generator.reset()
+        local.sync_generator_in_use = True
+        return generator
+
+    def _release_sync_generator(self, generator: AttemptGenerator) -> None:
+        local = self._local
+        if generator is getattr(local, "sync_generator", None):
+            local.sync_generator_in_use = False
+
+    def _new_async_generator(self) -> AsyncAttemptGenerator:
+        return AsyncAttemptGenerator(
+            until=self._stop_condition,
             wait=self.wait,
             before_attempt=self.before_attempt_hooks,
             on_success=self.on_success_hooks,
             on_failure=self.on_failure_hooks,
             before_wait=self.before_wait_hooks,
             after_wait=self.after_wait_hooks,
-        ):
-            with attempt:
-                result = self.fn(*args, **kwargs)
-                attempt.result = result
-                return result
+        )
+
+    def _acquire_async_generator(self) -> AsyncAttemptGenerator:
+        """
+        Get this thread's cached generator, or a fresh one if it is in use.
+        """
+        local = self._local
+        if getattr(local, "async_generator_in_use", False):
+            # Concurrent tasks on this loop; don't share iteration state.
+            return self._new_async_generator()
+        generator = getattr(local, "async_generator", None)
+        if generator is None:
+            generator = local.async_generator = self._new_async_generator()
+        else:
+            generator.reset()
+        local.async_generator_in_use = True
+        return generator
+
+    def _release_async_generator(self, generator: AsyncAttemptGenerator) -> None:
+        local = self._local
+        if generator is getattr(local, "async_generator", None):
+            local.async_generator_in_use = False
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        if self._is_coroutine_fn:
+            return self._call_async(*args, **kwargs)  # pyright: ignore[reportReturnType]
+
+        if not self._has_hooks:
+            # Fast path: with no hooks registered, a first-try success needs
+            # no generator or context-manager machinery at all. The default
+            # NoException condition can never stop before the first attempt,
+            # so only user-supplied conditions need the pre-attempt check.
+            if self.until is not None and self._stop_condition.is_met(None):
+                raise RuntimeError(
+                    "Failed to make a single attempt with the given stop condition"
+                )
+            try:
+                return self.fn(*args, **kwargs)
+            except BaseException as exc:
+                return self._retry_sync(exc, args, kwargs)
+
+        generator = self._acquire_sync_generator()
+        try:
+            for attempt in generator:
+                with attempt:
+                    result = self.fn(*args, **kwargs)
+                    attempt.result = result
+                    return result
+        finally:
+            self._release_sync_generator(generator)
 
         raise RuntimeError(
             "Failed to make a single attempt with the given stop condition"
         )
 
-    def _call_async(self, *args: P.args, **kwargs: P.kwargs) -> Awaitable[R]:
-        async def _call() -> R:
-            async for attempt in AsyncAttemptGenerator(
-                until=self.until,
-                wait=self.wait,
-                before_attempt=self.before_attempt_hooks,
-                on_success=self.on_success_hooks,
-                on_failure=self.on_failure_hooks,
-                before_wait=self.before_wait_hooks,
-                after_wait=self.after_wait_hooks,
-            ):
-                async with attempt:
-                    if TYPE_CHECKING:
-                        assert iscoroutinefunction(self.fn)  # pragma: no cover
+    def _retry_sync(
+        self,
+        first_exception: BaseException,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> R:
+        """
+        Continue retrying after a failed hook-free first attempt.
 
-                    result = await self.fn(*args, **kwargs)
+        Args:
+            first_exception: The exception raised by the first attempt.
+            args: The positional arguments for the wrapped function.
+            kwargs: The keyword arguments for the wrapped function.
+        """
+        if self._counted_retries and (max_attempts := self._max_attempts) is not None:
+            wait_seconds = self._wait_seconds
+            exception = first_exception
+            for _ in range(max_attempts - 1):
+                if wait_seconds is not None:
+                    time.sleep(wait_seconds)
+                try:
+                    return self.fn(*args, **kwargs)
+                except BaseException as exc:
+                    exception = exc
+            raise exception
+
+        generator = self._acquire_sync_generator()
+        try:
+            first_attempt = generator.get_next_attempt()
+            first_attempt.exception = first_exception
+            first_attempt.phase = Phase.FAILED
+
+            for attempt in generator:
+                with attempt:
+                    result = self.fn(*args, **kwargs)
                     attempt.result = result
                     return result
+        finally:
+            self._release_sync_generator(generator)
+
+        raise RuntimeError(
+            "Failed to make a single attempt with the given stop condition"
+        )
+
+    def _call_async(self, *args: P.args, **kwargs: P.kwargs) -> Awaitable[R]:
+        async def _call() -> R:
+            if TYPE_CHECKING:
+                assert iscoroutinefunction(self.fn)  # pragma: no cover
+
+            if not self._has_hooks:
+                # Fast path: with no hooks registered, a first-try success
+                # needs no generator or context-manager machinery at all.
+                # The default NoException condition can never stop before the
+                # first attempt, so only user-supplied conditions are checked.
+                if self.until is not None and self._stop_condition.is_met(None):
+                    raise RuntimeError(
+                        "Failed to make a single attempt with the given stop condition"
+                    )
+                try:
+                    return await self.fn(*args, **kwargs)
+                except BaseException as exc:
+                    return await self._retry_async(exc, args, kwargs)
+
+            generator = self._acquire_async_generator()
+            try:
+                async for attempt in generator:
+                    async with attempt:
+                        result = await self.fn(*args, **kwargs)
+                        attempt.result = result
+                        return result
+            finally:
+                self._release_async_generator(generator)
 
             raise RuntimeError(
                 "Failed to make a single attempt with the given stop condition"
@@ -104,6 +314,107 @@ class Retriable(Generic[P, R]):
 
         return _call()
 
+    async def _retry_async(
+        self,
+        first_exception: BaseException,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> R:
+        """
+        Continue retrying after a failed hook-free first attempt.
+
+        Args:
+            first_exception: The exception raised by the first attempt.
+            args: The positional arguments for the wrapped function.
+            kwargs: The keyword arguments for the wrapped function.
+        """
+        if TYPE_CHECKING:
+            assert iscoroutinefunction(self.fn)  # pragma: no cover
+
+        if self._counted_retries and (max_attempts := self._max_attempts) is not None:
+            wait_seconds = self._wait_seconds
+            exception = first_exception
+            for _ in range(max_attempts - 1):
+                if wait_seconds is not None:
+                    await asyncio.sleep(wait_seconds)
+                try:
+                    return await self.fn(*args, **kwargs)
+                except BaseException as exc:
+                    exception = exc
+            raise exception
+
+        generator = self._acquire_async_generator()
+        try:
+            first_attempt = generator.get_next_attempt()
+            first_attempt.exception = first_exception
+            first_attempt.phase = Phase.FAILED
+
+            async for attempt in generator:
+                async with attempt:
+                    result = await self.fn(*args, **kwargs)
+                    attempt.result = result
+                    return result
+        finally:
+            self._release_async_generator(generator)
+
+        raise RuntimeError(
+            "Failed to make a single attempt with the given stop condition"
+        )
+
+    def map(self, inputs: Iterable[Any]) -> list[R]:
+        """
+        Call the wrapped function once per input, retrying each failure.
+
+        Amortizes per-call setup across the batch: attribute loads and the
+        pre-attempt stop-condition check happen once instead of once per
+        input.
+
+        Args:
+            inputs: Values passed one at a time as the sole positional
+                argument of the wrapped function.
+
+        Returns:
+            The results for each input, in order.
+        """
+        if self._is_coroutine_fn:
+            raise TypeError("Retriable.map does not support coroutine functions")
+
+        # P is opaque here; map's contract is a single positional argument.
+        fn = cast("Callable[[Any], R]", self.fn)
+        results: list[R] = []
+        append = results.append
+
+        if not self._has_hooks:
+            if self.until is not None and self._stop_condition.is_met(None):
+                raise RuntimeError(
+                    "Failed to make a single attempt with the given stop condition"
+                )
+            retry_failed = self._retry_sync
+            for value in inputs:
+                try:
+                    append(fn(value))
+                except BaseException as exc:
+                    append(retry_failed(exc, (value,), {}))
+            return results
+
+        generator = self._acquire_sync_generator()
+        try:
+            for value in inputs:
+                for attempt in generator:
+                    with attempt:
+                        result = fn(value)
+                        attempt.result = result
+                        append(result)
+                        break
+                else:
+                    raise RuntimeError(
+                        "Failed to make a single attempt with the given stop condition"
+                    )
+                generator.reset()
+        finally:
+            self._release_sync_generator(generator)
+        return results
+
     def before_attempt(self, hook: H) -> H:
         """
         Add a hook that will be called before each attempt.
@@ -123,6 +434,7 @@ class Retriable(Generic[P, R]):
         ```
         """
         self.before_attempt_hooks.append(hook)
+        self._has_hooks = True
         return hook
 
     def on_success(self, hook: H) -> H:
@@ -143,6 +455,7 @@ class Retriable(Generic[P, R]):
             print(f"Attempt {state.attempt} succeeded")
         """
         self.on_success_hooks.append(hook)
+        self._has_hooks = True
         return hook
 
     def on_failure(self, hook: H) -> H:
@@ -164,6 +477,7 @@ class Retriable(Generic[P, R]):
         ```
         """
         self.on_failure_hooks.append(hook)
+        self._has_hooks = True
         return hook
 
     def before_wait(self, hook: H) -> H:
@@ -185,6 +499,7 @@ class Retriable(Generic[P, R]):
         ```
         """
         self.before_wait_hooks.append(hook)
+        self._has_hooks = True
         return hook
 
     def after_wait(self, hook: H) -> H:
@@ -206,6 +521,7 @@ class Retriable(Generic[P, R]):
         ```
         """
         self.after_wait_hooks.append(hook)
+        self._has_hooks = True
         return hook
 
 
@@ -289,11 +605,9 @@ def retry(
         ```
     """
     if __fn is None:
-        return cast(
-            Callable[
-                [Callable[P, R]],
-                Retriable[P, R],
-            ],
-            partial(retry, until=until, wait=wait),
-        )
+
+        def decorator(fn: Callable[P, R]) -> Retriable[P, R]:
+            return Retriable(fn, until=until, wait=wait)
+
+        return decorator
     return Retriable(__fn, until=until, wait=wait)
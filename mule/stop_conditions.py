@@ -1,18 +1,28 @@
 from __future__ import annotations
 
-import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 if TYPE_CHECKING:
     from mule._attempts.dataclasses import AttemptState  # pragma: no cover
 
 
-class StopCondition(abc.ABC):
+class StopCondition:
     """
     A protocol that defines a stopping condition for an attempting generator.
+
+    Subclasses must implement `is_met`. This is a plain base class rather
+    than an `abc.ABC` so isinstance checks and method lookups skip the
+    `ABCMeta` machinery.
     """
 
-    @abc.abstractmethod
+    __slots__ = ()
+
+    # Relative evaluation cost, used by the composite conditions to order
+    # their children cheapest-first. Conditions are assumed to be pure
+    # predicates, so evaluation order is not observable. Subclasses with an
+    # unknown cost keep the default and sort last.
+    _cost = 3
+
     def is_met(self, context: AttemptState | None) -> bool:
         """
         Checks if execution should stop.
@@ -23,7 +33,25 @@ class StopCondition(abc.ABC):
         Returns:
             True if the stopping condition is met, False otherwise.
         """
-        ...  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
+
+    def check(self, context: AttemptState | None) -> tuple[bool, BaseException | None]:
+        """
+        Checks if execution should stop and surfaces the exception to raise.
+
+        Combines `is_met` with the follow-up exception read so callers don't
+        walk the attempt state twice per iteration.
+
+        Args:
+            context: The current attempt context.
+
+        Returns:
+            A tuple of (done, exception); `exception` is the last attempt's
+            exception when the condition is met, otherwise None.
+        """
+        if self.is_met(context):
+            return True, context.exception if context is not None else None
+        return False, None
 
     def __and__(self, other: StopCondition) -> StopCondition:
         return IntersectionStopCondition(self, other)
@@ -32,9 +60,25 @@ class StopCondition(abc.ABC):
         return UnionStopCondition(self, other)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, StopCondition):
+        if other.__class__ is not self.__class__:
             return False
-        return self.__dict__ == other.__dict__
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if getattr(self, name) != getattr(other, name):
+                    return False
+        # Subclasses without __slots__ keep their state in __dict__.
+        return getattr(self, "__dict__", {}) == getattr(other, "__dict__", {})
+
+    def __hash__(self) -> int:
+        values: list[object] = [self.__class__]
+        for klass in type(self).__mro__:
+            values.extend(
+                getattr(self, name) for name in getattr(klass, "__slots__", ())
+            )
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            values.extend(sorted(instance_dict.items()))
+        return hash(tuple(values))
 
     def __invert__(self) -> StopCondition:
         return InvertedStopCondition(self)
@@ -46,6 +90,21 @@ class NoException(StopCondition):
     context.
     """
 
+    __slots__ = ()
+
+    _cost = 1
+
+    _instance: NoException | None = None
+
+    def __new__(cls) -> NoException:
+        # NoException is stateless and constructed on nearly every generator
+        # and Retriable init, so hand out a single shared instance.
+        if cls is not NoException:
+            return super().__new__(cls)
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def is_met(self, context: AttemptState | None) -> bool:
         if context is None:
             return False
@@ -54,16 +113,30 @@ class NoException(StopCondition):
 
 class ExceptionMatches(StopCondition):
     """
-    A StopCondition implementation that stops if the exception matches the given type.
+    A StopCondition implementation that stops if the exception matches the given
+    type, or any of a tuple of types.
     """
 
-    def __init__(self, exception_type: type[BaseException]):
+    __slots__ = ("exception_type",)
+
+    _cost = 2
+
+    def __init__(
+        self,
+        exception_type: type[BaseException] | tuple[type[BaseException], ...],
+    ):
         self.exception_type = exception_type
 
-    def is_met(self, context: AttemptState | None) -> bool:
-        if context is None:
-            return False
-        return isinstance(context.exception, self.exception_type)
+    def is_met(
+        self,
+        context: AttemptState | None,
+        # Bound as a default so the hot path loads it from the frame instead
+        # of chasing the globals/builtins chain on every check.
+        _isinstance: Callable[[Any, Any], bool] = isinstance,
+    ) -> bool:
+        return context is not None and _isinstance(
+            context.exception, self.exception_type
+        )
 
 
 class AttemptsExhausted(StopCondition):
@@ -75,6 +148,27 @@ class AttemptsExhausted(StopCondition):
             this many failed attempts.
     """
 
+    __slots__ = ("max_attempts",)
+
+    _cost = 0
+
+    # Small retry budgets recur across many decorated functions; intern them
+    # so equal conditions share one instance and composite dedup can hit.
+    _cache: ClassVar[dict[int, AttemptsExhausted]] = {}
+    _max_interned = 16
+
+    def __new__(cls, max_attempts: int) -> AttemptsExhausted:
+        if (
+            cls is AttemptsExhausted
+            and type(max_attempts) is int
+            and 0 < max_attempts <= cls._max_interned
+        ):
+            cached = cls._cache.get(max_attempts)
+            if cached is None:
+                cached = cls._cache[max_attempts] = super().__new__(cls)
+            return cached
+        return super().__new__(cls)
+
     def __init__(self, max_attempts: int):
         if max_attempts <= 0:
             raise ValueError("max_attempts must be greater than 0")
@@ -86,17 +180,74 @@ class AttemptsExhausted(StopCondition):
         return context.attempt >= self.max_attempts
 
 
+def _by_cost(condition: StopCondition) -> int:
+    return condition._cost
+
+
+# Built-in conditions compare by value and are known-pure, so folding
+# equal duplicates out of a composite cannot change its meaning. User
+# subclasses are only folded when the very same instance repeats.
+_PURE_CONDITION_TYPES = (AttemptsExhausted, ExceptionMatches, NoException)
+
+
+def _is_duplicate(condition: StopCondition, seen: list[StopCondition]) -> bool:
+    if type(condition) in _PURE_CONDITION_TYPES:
+        return condition in seen
+    return any(existing is condition for existing in seen)
+
+
 class IntersectionStopCondition(StopCondition):
     """
     A StopCondition implementation that stops if all of the given StopCondition
     instances are met.
     """
 
+    __slots__ = ("_checks", "conditions")
+
     def __init__(self, *conditions: StopCondition):
-        self.conditions: tuple[StopCondition, ...] = conditions
+        # Chained `a & b & c` nests left-associatively; splice same-class
+        # children in so evaluation walks one flat tuple, then order
+        # cheapest-first so short-circuiting settles most checks before
+        # reaching the expensive children.
+        flat: list[StopCondition] = []
+        for condition in conditions:
+            if type(condition) is IntersectionStopCondition:
+                for child in condition.conditions:
+                    if not _is_duplicate(child, flat):
+                        flat.append(child)
+            elif not _is_duplicate(condition, flat):
+                # `a & a` reduces to `a`.
+                flat.append(condition)
+        self.conditions: tuple[StopCondition, ...] = tuple(sorted(flat, key=_by_cost))
+        # Bind each child's is_met once so evaluation skips the per-check
+        # attribute lookup and method binding.
+        self._checks: tuple[Callable[[AttemptState | None], bool], ...] = tuple(
+            condition.is_met for condition in self.conditions
+        )
 
     def is_met(self, context: AttemptState | None) -> bool:
-        return all(condition.is_met(context) for condition in self.conditions)
+        checks = self._checks
+        if len(checks) == 2:
+            # The common `a & b` shape; skip the loop machinery entirely.
+            first, second = checks
+            return first(context) and second(context)
+        # Deliberately not all(): a genexp allocates a generator per check
+        # on this hot path.
+        for check in checks:  # noqa: SIM110
+            if not check(context):
+                return False
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        # The _checks cache holds bound methods, which compare by the
+        # identity of their instances; equality is structural, so compare
+        # the child conditions only.
+        if other.__class__ is not self.__class__:
+            return False
+        return self.conditions == getattr(other, "conditions", None)
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.conditions))
 
 
 class UnionStopCondition(StopCondition):
@@ -105,11 +256,68 @@ class UnionStopCondition(StopCondition):
     instances are met.
     """
 
+    __slots__ = ("_checks", "conditions")
+
     def __init__(self, *conditions: StopCondition):
-        self.conditions: tuple[StopCondition, ...] = conditions
+        # Chained `a | b | c` nests left-associatively; splice same-class
+        # children in so evaluation walks one flat tuple, then order
+        # cheapest-first so short-circuiting settles most checks before
+        # reaching the expensive children.
+        flat: list[StopCondition] = []
+        for condition in conditions:
+            if type(condition) is UnionStopCondition:
+                for child in condition.conditions:
+                    if not _is_duplicate(child, flat):
+                        flat.append(child)
+            elif not _is_duplicate(condition, flat):
+                # `a | a` reduces to `a`.
+                flat.append(condition)
+        matchers = [child for child in flat if type(child) is ExceptionMatches]
+        if len(matchers) > 1:
+            # ExceptionMatches(A) | ExceptionMatches(B) collapses to a single
+            # isinstance call against a tuple of types.
+            types: list[type[BaseException]] = []
+            for matcher in matchers:
+                exception_type = matcher.exception_type
+                if isinstance(exception_type, tuple):
+                    for item in exception_type:
+                        if item not in types:
+                            types.append(item)
+                elif exception_type not in types:
+                    types.append(exception_type)
+            index = flat.index(matchers[0])
+            flat = [child for child in flat if type(child) is not ExceptionMatches]
+            flat.insert(index, ExceptionMatches(tuple(types)))
+        self.conditions: tuple[StopCondition, ...] = tuple(sorted(flat, key=_by_cost))
+        # Bind each child's is_met once so evaluation skips the per-check
+        # attribute lookup and method binding.
+        self._checks: tuple[Callable[[AttemptState | None], bool], ...] = tuple(
+            condition.is_met for condition in self.conditions
+        )
 
     def is_met(self, context: AttemptState | None) -> bool:
-        return any(condition.is_met(context) for condition in self.conditions)
+        checks = self._checks
+        if len(checks) == 2:
+            # The common `a | b` shape; skip the loop machinery entirely.
+            first, second = checks
+            return first(context) or second(context)
+        # Deliberately not any(): a genexp allocates a generator per check
+        # on this hot path.
+        for check in checks:  # noqa: SIM110
+            if check(context):
+                return True
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        # The _checks cache holds bound methods, which compare by the
+        # identity of their instances; equality is structural, so compare
+        # the child conditions only.
+        if other.__class__ is not self.__class__:
+            return False
+        return self.conditions == getattr(other, "conditions", None)
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.conditions))
 
 
 class InvertedStopCondition(StopCondition):
@@ -117,6 +325,8 @@ class InvertedStopCondition(StopCondition):
     A StopCondition implementation that inverts the given StopCondition.
     """
 
+    __slots__ = ("condition",)
+
     def __init__(self, condition: StopCondition):
         self.condition = condition
 
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mule._attempts.dataclasses import AttemptState  # pragma: no cover
+
+
+class FullJitterBackoff:
+    """
+    A `WaitTimeProvider` implementation of exponential backoff with full jitter.
+
+    Each wait is drawn uniformly from `[0, min(cap, base * 2 ** (attempt - 1)))`,
+    which spreads concurrent retriers out instead of letting them retry in
+    lockstep.
+
+    Attributes:
+        base: The backoff multiplier, in seconds.
+        cap: The maximum wait time, in seconds.
+    """
+
+    __slots__ = ("_random", "base", "cap")
+
+    def __init__(self, base: float, cap: float):
+        if base <= 0:
+            raise ValueError("base must be greater than 0")
+        if cap <= 0:
+            raise ValueError("cap must be greater than 0")
+        self.base = base
+        self.cap = cap
+        self._random = random.random
+
+    def __call__(self, prev: AttemptState | None, next: AttemptState) -> float:  # noqa: ARG002
+        bound = self.base * (1 << (next.attempt - 1))
+        if bound > self.cap:
+            bound = self.cap
+        return self._random() * bound
+
+
+class DecorrelatedJitter:
+    """
+    A `WaitTimeProvider` implementation of decorrelated jitter.
+
+    Each wait is drawn uniformly from `[base, prev_wait * 3)` and capped at
+    `cap`, so successive waits grow from the previous wait rather than the
+    attempt number.
+
+    Attributes:
+        base: The minimum wait time, in seconds.
+        cap: The maximum wait time, in seconds.
+    """
+
+    __slots__ = ("_prev_wait", "_random", "base", "cap")
+
+    def __init__(self, base: float, cap: float):
+        if base <= 0:
+            raise ValueError("base must be greater than 0")
+        if cap < base:
+            raise ValueError("cap must be greater than or equal to base")
+        self.base = base
+        self.cap = cap
+        self._prev_wait = base
+        self._random = random.random
+
+    def __call__(self, prev: AttemptState | None, next: AttemptState) -> float:  # noqa: ARG002
+        wait = self.base + self._random() * (self._prev_wait * 3 - self.base)
+        if wait > self.cap:
+            wait = self.cap
+        self._prev_wait = wait
+        return wait
+
+
+__all__ = [
+    "DecorrelatedJitter",
+    "FullJitterBackoff",
+]
@@ -88,6 +88,23 @@ class TestWait:
         else:
             mock_sleep.assert_called_once_with(wait)
 
+    @pytest.mark.parametrize("wait", [0, 0.0, datetime.timedelta(0)])
+    def test_falsy_wait_skips_waiting(
+        self, wait: int | float | datetime.timedelta, mock_sleep: MagicMock
+    ):
+        attempts = 0
+        hook = MagicMock()
+        for attempt in attempting(
+            until=AttemptsExhausted(3), wait=wait, before_wait=[hook]
+        ):
+            with attempt:
+                attempts += 1
+                if attempts < 2:
+                    raise Exception("Test exception")
+
+        mock_sleep.assert_not_called()
+        hook.assert_not_called()
+
     def test_wait_with_exponential_backoff_callable(self, mock_sleep: MagicMock):
         attempts = 0
 
@@ -128,6 +145,23 @@ class TestAsyncWait:
         else:
             mock_async_sleep.assert_awaited_once_with(wait)
 
+    @pytest.mark.parametrize("wait", [0, 0.0, datetime.timedelta(0)])
+    async def test_falsy_wait_skips_waiting(
+        self, wait: int | float | datetime.timedelta, mock_async_sleep: AsyncMock
+    ):
+        attempts = 0
+        hook = MagicMock()
+        async for attempt in attempting_async(
+            until=AttemptsExhausted(3), wait=wait, before_wait=[hook]
+        ):
+            async with attempt:
+                attempts += 1
+                if attempts < 2:
+                    raise Exception("Test exception")
+
+        mock_async_sleep.assert_not_awaited()
+        hook.assert_not_called()
+
     async def test_wait_with_exponential_backoff_callable(
         self, mock_async_sleep: AsyncMock
     ):
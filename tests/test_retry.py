@@ -55,6 +55,52 @@ class TestRetriable:
         assert getattr(r, "__name__", None) == "sometimes_fails"
         assert getattr(r, "__doc__", None) == sometimes_fails.__doc__
 
+    def test_map(self):
+        r = Retriable(always_succeeds, until=AttemptsExhausted(3))
+        assert r.map([1, 2, 3]) == [2, 4, 6]
+
+    def test_map_retries_each_input(self):
+        calls: dict[int, int] = {}
+
+        def fn(x: int) -> int:
+            calls[x] = calls.get(x, 0) + 1
+            if calls[x] < 2:
+                raise Exception("fail")
+            return x
+
+        r = Retriable(fn, until=AttemptsExhausted(3))
+        assert r.map([1, 2]) == [1, 2]
+        assert calls == {1: 2, 2: 2}
+
+    def test_map_with_hooks(self):
+        hook = MagicMock()
+        r = Retriable(always_succeeds, until=AttemptsExhausted(3))
+        r.on_success(hook)
+        assert r.map([1, 2]) == [2, 4]
+        assert hook.call_count == 2
+
+    def test_map_with_invalid_stop_condition_and_hooks(self):
+        class NeverAttempt(StopCondition):
+            def is_met(self, context: AttemptState | None) -> bool:  # noqa: ARG002
+                return True
+
+        r = Retriable(always_succeeds, until=NeverAttempt())
+        r.on_success(MagicMock())
+
+        with pytest.raises(
+            RuntimeError,
+            match="Failed to make a single attempt with the given stop condition",
+        ):
+            r.map([1, 2])
+
+    def test_map_rejects_coroutine_function(self):
+        async def fn(x: int) -> int:
+            return x
+
+        r = Retriable(fn, until=AttemptsExhausted(3))
+        with pytest.raises(TypeError):
+            r.map([1])
+
 
 class TestRetryDecorator:
     class TestSync:
@@ -101,6 +147,25 @@ class TestRetryDecorator:
             ):
                 f(3)
 
+        def test_retry_with_invalid_stop_condition_and_hooks(self):
+            class NeverAttempt(StopCondition):
+                def is_met(self, context: AttemptState | None) -> bool:  # noqa: ARG002
+                    return True
+
+            @retry(until=NeverAttempt())
+            def f(x: int) -> int:
+                return x * 3
+
+            hook = MagicMock()
+            f.on_success(hook)
+
+            with pytest.raises(
+                RuntimeError,
+                match="Failed to make a single attempt with the given stop condition",
+            ):
+                f(3)
+            hook.assert_not_called()
+
         @pytest.mark.parametrize("wait", [5, datetime.timedelta(minutes=5), 5.0])
         def test_retry_decorator_with_wait(
             self, wait: int | float | datetime.timedelta, mock_sleep: MagicMock
@@ -219,6 +284,25 @@ class TestRetryDecorator:
             ):
                 await f(3)
 
+        async def test_retry_with_invalid_stop_condition_and_hooks(self):
+            class NeverAttempt(StopCondition):
+                def is_met(self, context: AttemptState | None) -> bool:  # noqa: ARG002
+                    return True
+
+            @retry(until=NeverAttempt())
+            async def f(x: int) -> int:
+                return x * 3
+
+            hook = MagicMock()
+            f.on_success(hook)
+
+            with pytest.raises(
+                RuntimeError,
+                match="Failed to make a single attempt with the given stop condition",
+            ):
+                await f(3)
+            hook.assert_not_called()
+
         @pytest.mark.parametrize("wait", [5, datetime.timedelta(minutes=5), 5.0])
         async def test_retry_decorator_with_wait(
             self, wait: int | float | datetime.timedelta, mock_async_sleep: AsyncMock
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import pytest
 
 from mule._attempts.dataclasses import AttemptState, Phase
@@ -6,10 +8,21 @@ from mule.stop_conditions import (
     ExceptionMatches,
     IntersectionStopCondition,
     NoException,
+    StopCondition,
     UnionStopCondition,
 )
 
 
+class DictBackedCondition(StopCondition):
+    """A user-style subclass without __slots__; state lives in __dict__."""
+
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+
+    def is_met(self, context: AttemptState | None) -> bool:
+        return context is not None and context.attempt >= self.threshold
+
+
 class TestStopCondition:
     def test_eq(self):
         stop_condition = AttemptsExhausted(3)
@@ -18,6 +31,48 @@ class TestStopCondition:
         assert stop_condition != NoException()
         assert stop_condition != 3
 
+    def test_eq_with_dict_backed_subclass(self):
+        assert DictBackedCondition(1) == DictBackedCondition(1)
+        assert DictBackedCondition(1) != DictBackedCondition(2)
+
+    def test_eq_composites(self):
+        assert (ExceptionMatches(ValueError) | AttemptsExhausted(3)) == (
+            ExceptionMatches(ValueError) | AttemptsExhausted(3)
+        )
+        assert (ExceptionMatches(ValueError) & AttemptsExhausted(3)) == (
+            ExceptionMatches(ValueError) & AttemptsExhausted(3)
+        )
+        assert (ExceptionMatches(ValueError) | AttemptsExhausted(3)) != (
+            ExceptionMatches(ValueError) | AttemptsExhausted(4)
+        )
+
+    def test_hash(self):
+        assert hash(AttemptsExhausted(3)) == hash(AttemptsExhausted(3))
+        assert len({AttemptsExhausted(3), AttemptsExhausted(3)}) == 1
+        assert len({AttemptsExhausted(3), AttemptsExhausted(4)}) == 2
+
+
+class TestCheck:
+    def test_check_not_met(self):
+        stop_condition = AttemptsExhausted(3)
+        assert stop_condition.check(None) == (False, None)
+
+        context = AttemptState(attempt=1, phase=Phase.FAILED)
+        context.exception = RuntimeError()
+        assert stop_condition.check(context) == (False, None)
+
+    def test_check_met_surfaces_exception(self):
+        stop_condition = AttemptsExhausted(3)
+        exception = RuntimeError()
+        context = AttemptState(attempt=3, phase=Phase.FAILED)
+        context.exception = exception
+        assert stop_condition.check(context) == (True, exception)
+
+    def test_check_met_without_exception(self):
+        stop_condition = NoException()
+        context = AttemptState(attempt=1, phase=Phase.SUCCEEDED)
+        assert stop_condition.check(context) == (True, None)
+
 
 class TestAttemptsExhausted:
     def test_attempts_exhausted(self):
@@ -36,6 +91,10 @@ class TestAttemptsExhausted:
         context.exception = RuntimeError()
         assert stop_condition.is_met(context) is True
 
+    def test_small_instances_are_interned(self):
+        assert AttemptsExhausted(3) is AttemptsExhausted(3)
+        assert AttemptsExhausted(1000) is not AttemptsExhausted(1000)
+
     def test_invalid_max_attempts(self):
         with pytest.raises(ValueError):
             AttemptsExhausted(0)
@@ -63,6 +122,30 @@ class TestExceptionMatches:
         context.exception = RuntimeError()
         assert stop_condition.is_met(context) is True
 
+    def test_exception_matches_tuple_of_types(self):
+        stop_condition = ExceptionMatches((RuntimeError, ValueError))
+
+        context = AttemptState(attempt=1, phase=Phase.FAILED)
+        context.exception = ValueError()
+        assert stop_condition.is_met(context) is True
+
+        context.exception = KeyError()
+        assert stop_condition.is_met(context) is False
+
+    def test_union_fuses_sibling_matchers(self):
+        stop_condition = ExceptionMatches(RuntimeError) | ExceptionMatches(ValueError)
+        assert isinstance(stop_condition, UnionStopCondition)
+        assert stop_condition.conditions == (
+            ExceptionMatches((RuntimeError, ValueError)),
+        )
+
+        context = AttemptState(attempt=1, phase=Phase.FAILED)
+        context.exception = ValueError()
+        assert stop_condition.is_met(context) is True
+
+        context.exception = KeyError()
+        assert stop_condition.is_met(context) is False
+
 
 class TestIntersectionStopCondition:
     def test_all_conditions_met(self):
@@ -195,6 +278,38 @@ class TestComplexStopConditionCombinations:
             stop_condition.is_met(context) is False
         )  # ExceptionMatches(ValueError) not met
 
+    def test_chained_composites_are_flattened(self):
+        stop_condition = (
+            AttemptsExhausted(3) & NoException() & ExceptionMatches(ValueError)
+        )
+        assert isinstance(stop_condition, IntersectionStopCondition)
+        assert len(stop_condition.conditions) == 3
+
+        stop_condition = (
+            AttemptsExhausted(3) | NoException() | ExceptionMatches(ValueError)
+        )
+        assert isinstance(stop_condition, UnionStopCondition)
+        assert len(stop_condition.conditions) == 3
+
+    def test_duplicate_conditions_are_folded(self):
+        stop_condition = AttemptsExhausted(3) | AttemptsExhausted(3) | NoException()
+        assert isinstance(stop_condition, UnionStopCondition)
+        assert stop_condition.conditions == (AttemptsExhausted(3), NoException())
+
+        context = AttemptState(attempt=3, phase=Phase.FAILED)
+        context.exception = RuntimeError()
+        assert stop_condition.is_met(context) is True
+
+    def test_distinct_custom_conditions_are_kept(self):
+        stop_condition = DictBackedCondition(1) | DictBackedCondition(2)
+        assert isinstance(stop_condition, UnionStopCondition)
+        assert len(stop_condition.conditions) == 2
+
+        duplicate = DictBackedCondition(1)
+        stop_condition = duplicate | duplicate
+        assert isinstance(stop_condition, UnionStopCondition)
+        assert len(stop_condition.conditions) == 1
+
     def test_multiple_or(self):
         # AttemptsExhausted(3) | NoException() | ExceptionMatches(ValueError)
         stop_condition = (
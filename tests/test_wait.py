@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mule import attempting
+from mule._attempts import AttemptState
+from mule.stop_conditions import AttemptsExhausted
+from mule.wait import DecorrelatedJitter, FullJitterBackoff
+
+
+def _state(attempt: int) -> AttemptState:
+    return AttemptState(attempt=attempt)
+
+
+class TestFullJitterBackoff:
+    def test_rejects_non_positive_base(self):
+        with pytest.raises(ValueError, match="base must be greater than 0"):
+            FullJitterBackoff(0, 1.0)
+
+    def test_rejects_non_positive_cap(self):
+        with pytest.raises(ValueError, match="cap must be greater than 0"):
+            FullJitterBackoff(0.05, 0)
+
+    def test_wait_is_within_exponential_bound(self):
+        backoff = FullJitterBackoff(0.05, 100.0)
+        for attempt in range(2, 8):
+            for _ in range(100):
+                wait = backoff(None, _state(attempt))
+                assert 0 <= wait < 0.05 * 2 ** (attempt - 1)
+
+    def test_wait_is_capped(self):
+        backoff = FullJitterBackoff(1.0, 2.0)
+        for _ in range(100):
+            assert backoff(None, _state(10)) < 2.0
+
+    def test_works_as_wait_provider(self, mock_sleep: MagicMock):
+        attempts = 0
+        for attempt in attempting(
+            until=AttemptsExhausted(3), wait=FullJitterBackoff(0.05, 1.0)
+        ):
+            with attempt:
+                attempts += 1
+                if attempts < 3:
+                    raise Exception("Test exception")
+
+        assert attempts == 3
+        assert mock_sleep.call_count == 2
+
+
+class TestDecorrelatedJitter:
+    def test_rejects_non_positive_base(self):
+        with pytest.raises(ValueError, match="base must be greater than 0"):
+            DecorrelatedJitter(0, 1.0)
+
+    def test_rejects_cap_below_base(self):
+        with pytest.raises(ValueError, match="cap must be greater than or equal"):
+            DecorrelatedJitter(1.0, 0.5)
+
+    def test_wait_is_within_bounds(self):
+        jitter = DecorrelatedJitter(0.05, 1.0)
+        for attempt in range(2, 20):
+            wait = jitter(None, _state(attempt))
+            assert 0.05 <= wait <= 1.0
+
+    def test_works_as_wait_provider(self, mock_sleep: MagicMock):
+        attempts = 0
+        for attempt in attempting(
+            until=AttemptsExhausted(3), wait=DecorrelatedJitter(0.05, 1.0)
+        ):
+            with attempt:
+                attempts += 1
+                if attempts < 3:
+                    raise Exception("Test exception")
+
+        assert attempts == 3
+        assert mock_sleep.call_count == 2